@@ -6,10 +6,9 @@ This module implements the async interface to Motion Blinds.
 """
 
 import logging
-import json
 import asyncio
 
-from .motion_blinds import MotionCommunication
+from .motion_blinds import MotionCommunication, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -108,7 +107,7 @@ class AsyncMotionMulticast(MotionCommunication):
             """Handle received messages."""
             try:
                 (ip_add, _) = addr
-                message = json.loads(data)
+                message = json_loads(data)
 
                 if ip_add not in self._parent.registered_callbacks:
                     _LOGGER.info("Unknown motion gateway ip %s", ip_add)
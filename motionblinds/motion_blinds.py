@@ -10,20 +10,29 @@ import socket
 import json
 import re
 import struct
+import time
 import datetime
 from enum import IntEnum
-from threading import Thread
+from threading import Thread, Lock, Event, Timer
 from Cryptodome.Cipher import AES
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 MULTICAST_ADDRESS = "238.0.0.18"
 UDP_PORT_SEND = 32100
 UDP_PORT_RECEIVE = 32101
 SOCKET_BUFSIZE = 4096
+SOCKET_RCVBUF = 4 * 1024 * 1024  # kernel receive buffer, absorbs bursts of multicast pushes
+SOCKET_SNDBUF = 64 * 1024  # kernel send buffer
 MAX_RESPONSE_LENGTH = 1024
+RECV_BATCH_SIZE = 64  # max number of queued datagrams processed per wake-up of the listener
 
-DEVICE_TYPES_GATEWAY = ["02000001", "02000002"]  # Gateway
+DEVICE_TYPES_GATEWAY = frozenset(("02000001", "02000002"))  # Gateway
 DEVICE_TYPE_BLIND = "10000000"  # Standard Blind
 DEVICE_TYPE_TDBU = "10000001"  # Top Down Bottom Up
 DEVICE_TYPE_DR = "10000002"  # Double Roller
@@ -31,13 +40,55 @@ DEVICE_TYPE_DR = "10000002"  # Double Roller
 DEVICE_TYPE_WIFI_CURTAIN = "22000000"  # Curtain direct WiFi
 DEVICE_TYPE_WIFI_BLIND = "22000002"  # Standard Blind direct WiFi
 DEVICE_TYPE_WIFI_GATE = "22000005"  # Garage gate direct WiFi (for example Krispol)
-DEVICE_TYPES_WIFI = [
-    DEVICE_TYPE_WIFI_BLIND,
-    DEVICE_TYPE_WIFI_CURTAIN,
-    DEVICE_TYPE_WIFI_GATE,
-]  # Direct WiFi devices
-
-DEVICE_TYPES_CONTROLLER = DEVICE_TYPES_GATEWAY + DEVICE_TYPES_WIFI
+DEVICE_TYPES_WIFI = frozenset(
+    (
+        DEVICE_TYPE_WIFI_BLIND,
+        DEVICE_TYPE_WIFI_CURTAIN,
+        DEVICE_TYPE_WIFI_GATE,
+    )
+)  # Direct WiFi devices
+
+DEVICE_TYPES_CONTROLLER = DEVICE_TYPES_GATEWAY | DEVICE_TYPES_WIFI
+DEVICE_TYPES_BLIND = frozenset(
+    (
+        DEVICE_TYPE_BLIND,
+        DEVICE_TYPE_TDBU,
+        DEVICE_TYPE_DR,
+    )
+) | DEVICE_TYPES_WIFI  # Devices controlled as a blind
+
+# Resolved once, instead of on every multicast socket creation
+IP_PROTO_LEVEL = socket.IPPROTO_IP if hasattr(socket, "IPPROTO_IP") else socket.SOL_IP
+MREQ_ANY = struct.pack("=4sl", socket.inet_aton(MULTICAST_ADDRESS), socket.INADDR_ANY)
+
+# Battery packs as (max voltage, empty voltage, 100 / (full voltage - empty voltage))
+BATTERY_SEGMENTS = (
+    # 2 cel battery pack (8.4V)
+    (9.4, 6.2, 100 / (8.4 - 6.2)),
+    # 3 cel battery pack (12.6V)
+    # Motion Blinds specs: 10.4-12.6V
+    # Tested: 10.27-12.34V
+    (13.6, 10.27, 100 / (12.34 - 10.27)),
+    # 4 cel battery pack (16.8V)
+    (19.0, 14.6, 100 / (16.8 - 14.6)),
+)
+
+
+if orjson is not None:
+    # orjson parses bytes directly and serializes straight to bytes
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+
+    def json_loads(data):
+        """Deserialize JSON encoded bytes, str or a memoryview of bytes."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def json_dumps(obj):
+        """Serialize obj to JSON encoded bytes."""
+        return json.dumps(obj).encode("utf-8")
 
 
 class ParseException(Exception):
@@ -53,6 +104,9 @@ class GatewayStatus(IntEnum):
     Updating = 3
 
 
+GATEWAY_STATUS_BY_VALUE = {member.value: member for member in GatewayStatus}
+
+
 class BlindType(IntEnum):
     """Blind type matching of the blind using the values provided by the motion-gateway."""
 
@@ -84,6 +138,9 @@ class BlindType(IntEnum):
     TriangleBlind = 57
 
 
+BLIND_TYPE_BY_VALUE = {member.value: member for member in BlindType}
+
+
 class BlindStatus(IntEnum):
     """Status of the blind."""
 
@@ -97,6 +154,9 @@ class BlindStatus(IntEnum):
     JogDown = 8
 
 
+BLIND_STATUS_BY_VALUE = {member.value: member for member in BlindStatus}
+
+
 class LimitStatus(IntEnum):
     """Limit status of the blind."""
 
@@ -108,6 +168,9 @@ class LimitStatus(IntEnum):
     Limit3Detected = 4
 
 
+LIMIT_STATUS_BY_VALUE = {member.value: member for member in LimitStatus}
+
+
 class VoltageMode(IntEnum):
     """Voltage mode of the blind."""
 
@@ -116,6 +179,9 @@ class VoltageMode(IntEnum):
     DC = 1
 
 
+VOLTAGE_MODE_BY_VALUE = {member.value: member for member in VoltageMode}
+
+
 class WirelessMode(IntEnum):
     """Wireless mode of the blind."""
 
@@ -128,32 +194,54 @@ class WirelessMode(IntEnum):
     Others = 5
 
 
+WIRELESS_MODE_BY_VALUE = {member.value: member for member in WirelessMode}
+
+
+HIDE_PATTERN = re.compile("[a-zA-Z0-9]")
+
+
 def log_hide(message):
     """Hide security sensitive information from log messages"""
-    mess_copy = message.copy()
+    if isinstance(message, (bytes, bytearray)):
+        try:
+            message = json_loads(message)
+        except ValueError:
+            return message
 
-    if not isinstance(mess_copy, dict):
-        return mess_copy
+    if not isinstance(message, dict):
+        return message
 
-    hide_pattern = re.compile("[a-zA-Z0-9]")
+    mess_copy = message.copy()
     if "token" in mess_copy:
-        mess_copy["token"] = re.sub(hide_pattern, "x", mess_copy["token"])
+        mess_copy["token"] = HIDE_PATTERN.sub("x", mess_copy["token"])
     if "AccessToken" in mess_copy:
-        mess_copy["AccessToken"] = re.sub(hide_pattern, "x", mess_copy["AccessToken"])
+        mess_copy["AccessToken"] = HIDE_PATTERN.sub("x", mess_copy["AccessToken"])
 
     return mess_copy
 
 
+class LogHide:
+    """Lazily hide security sensitive information, only when the log record is formatted."""
+
+    __slots__ = ("_message",)
+
+    def __init__(self, message):
+        self._message = message
+
+    def __str__(self):
+        return str(log_hide(self._message))
+
+
 class MotionCommunication:
     """Communication class for Motion Gateways."""
 
     @staticmethod
     def _get_timestamp():
         """Get the current time and format according to required Message-ID (Timestamp)."""
-        time = datetime.datetime.utcnow()
-        time_str = time.strftime("%Y%m%d%H%M%S%f")[:-3]
+        sec, ms = divmod(int(time.time() * 1000), 1000)
+        tm = time.gmtime(sec)
 
-        return time_str
+        return f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}{ms:03d}"
 
     @staticmethod
     def _create_mcast_socket(interface, bind_interface, blocking=True):
@@ -162,7 +250,7 @@ class MotionCommunication:
         if interface == "any":
             ip32bit = socket.INADDR_ANY
             bind_interface = False
-            mreq = struct.pack("=4sl", socket.inet_aton(MULTICAST_ADDRESS), ip32bit)
+            mreq = MREQ_ANY
         else:
             ip32bit = socket.inet_aton(interface)
             mreq = socket.inet_aton(MULTICAST_ADDRESS) + ip32bit
@@ -171,36 +259,28 @@ class MotionCommunication:
             socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
         )
         udp_socket.setblocking(blocking)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # the kernel may cap the requested size (net.core.rmem_max on Linux)
+            _LOGGER.debug(
+                "Multicast socket receive buffer: requested %i bytes, got %i bytes",
+                SOCKET_RCVBUF,
+                udp_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+            )
 
         # Required for receiving multicast
         udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-
-        try:
-            udp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, ip32bit)
-        except:
-            _LOGGER.error(
-                "Error creating multicast socket using IPPROTO_IP, trying SOL_IP"
-            )
-            udp_socket.setsockopt(socket.SOL_IP, socket.IP_MULTICAST_IF, ip32bit)
-
         try:
-            udp_socket.setsockopt(
-                socket.IPPROTO_IP,
-                socket.IP_ADD_MEMBERSHIP,
-                mreq,
-            )
-        except:
-            _LOGGER.error(
-                "Error adding multicast socket membership using IPPROTO_IP, trying SOL_IP"
-            )
-            udp_socket.setsockopt(
-                socket.SOL_IP,
-                socket.IP_ADD_MEMBERSHIP,
-                mreq,
-            )
+            # Allow multiple listeners on the same host to bind the multicast port
+            udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (AttributeError, OSError):
+            pass
+        udp_socket.setsockopt(IP_PROTO_LEVEL, socket.IP_MULTICAST_IF, ip32bit)
 
         udp_socket.bind((interface if bind_interface else "", UDP_PORT_RECEIVE))
 
+        udp_socket.setsockopt(IP_PROTO_LEVEL, socket.IP_ADD_MEMBERSHIP, mreq)
+
         return udp_socket
 
 
@@ -220,24 +300,24 @@ class MotionDiscovery(MotionCommunication):
         self._mcastsocket = self._create_mcast_socket(
             self._interface, self._bind_interface
         )
-        self._mcastsocket.settimeout(self._discovery_time)
 
         msg = {"msgType": "GetDeviceList", "msgID": self._get_timestamp()}
 
         self._mcastsocket.sendto(
-            bytes(json.dumps(msg), "utf-8"), (MULTICAST_ADDRESS, UDP_PORT_SEND)
+            json_dumps(msg), (MULTICAST_ADDRESS, UDP_PORT_SEND)
         )
 
-        start_time = datetime.datetime.utcnow()
+        deadline = time.monotonic() + self._discovery_time
         while True:
-            time_delta = datetime.datetime.utcnow() - start_time
+            remaining = deadline - time.monotonic()
 
-            if time_delta.total_seconds() > self._discovery_time:
+            if remaining <= 0:
                 break
 
+            self._mcastsocket.settimeout(remaining)
             try:
                 data, (ip, _) = self._mcastsocket.recvfrom(SOCKET_BUFSIZE)
-                response = json.loads(data)
+                response = json_loads(data)
 
                 # check msgType
                 msgType = response.get("msgType")
@@ -280,7 +360,13 @@ class MotionDiscovery(MotionCommunication):
 
 
 class MotionMulticast(MotionCommunication):
-    """Multicast UDP communication class for a MotionGateway."""
+    """
+    Multicast UDP communication class for a MotionGateway.
+
+    The multicast socket is bound with SO_REUSEPORT where the platform supports it,
+    so multiple MotionMulticast instances (or processes) can listen on the same host,
+    each of them receives all multicast pushes.
+    """
 
     def __init__(self, interface="any", bind_interface=True):
         self._listening = False
@@ -288,33 +374,69 @@ class MotionMulticast(MotionCommunication):
         self._thread = None
         self._interface = interface
         self._bind_interface = bind_interface
+        self._recv_buf = memoryview(bytearray(SOCKET_BUFSIZE))
 
         self._registered_callbacks = {}
 
+    def _receive_msg(self):
+        """
+        Receive a single datagram into the preallocated buffer and decode it.
+
+        Return a (callback, message) tuple, or None if the datagram should be ignored.
+        """
+        nbytes, (ip_add, _) = self._mcastsocket.recvfrom_into(self._recv_buf)
+
+        callback = self._registered_callbacks.get(ip_add)
+        if callback is None:
+            _LOGGER.info("Unknown motion gateway ip %s", ip_add)
+            return None
+
+        data = self._recv_buf[:nbytes]
+        if not nbytes or data[0] != 0x7B:  # not a JSON object starting with "{"
+            _LOGGER.debug("Ignoring non JSON multicast message: '%s'", bytes(data))
+            return None
+
+        try:
+            message = json_loads(data)
+        except ValueError:
+            _LOGGER.error("Cannot parse multicast message: '%s'", LogHide(bytes(data)))
+            return None
+
+        return callback, message
+
     def _listen_to_msg(self):
         """Listen loop for UDP multicast messages for the Motion Gateway."""
         while self._listening:
             if self._mcastsocket is None:
                 continue
             try:
-                data, (ip_add, _) = self._mcastsocket.recvfrom(SOCKET_BUFSIZE)
+                batch = [self._receive_msg()]
             except socket.timeout:
                 continue
-            try:
-                message = json.loads(data)
 
-                if ip_add not in self._registered_callbacks:
-                    _LOGGER.info("Unknown motion gateway ip %s", ip_add)
+            # drain the datagrams that are already queued before processing them
+            timeout = self._mcastsocket.gettimeout()
+            self._mcastsocket.setblocking(False)
+            try:
+                while len(batch) < RECV_BATCH_SIZE:
+                    batch.append(self._receive_msg())
+            except BlockingIOError:
+                pass
+            finally:
+                self._mcastsocket.settimeout(timeout)
+
+            for item in batch:
+                if item is None:
                     continue
 
-                callback = self._registered_callbacks[ip_add]
-                callback(message)
-
-            except Exception:
-                _LOGGER.exception(
-                    "Cannot process multicast message: '%s'", log_hide(data)
-                )
-                continue
+                callback, message = item
+                try:
+                    callback(message)
+                except Exception:
+                    if _LOGGER.isEnabledFor(logging.ERROR):
+                        _LOGGER.exception(
+                            "Cannot process multicast message: '%s'", LogHide(message)
+                        )
 
         _LOGGER.info("Listener stopped")
 
@@ -397,6 +519,7 @@ class MotionGateway(MotionCommunication):
         mcast_timeout: float = 5.0,
         multi_resp_timeout: float = 0.2,
         multicast: MotionMulticast = None,
+        batch_interval: float = 0.0,
     ):
         self._ip = ip
         self._key = key
@@ -407,9 +530,18 @@ class MotionGateway(MotionCommunication):
         self._timeout = timeout
         self._mcast_timeout = mcast_timeout
         self._multi_resp_timeout = multi_resp_timeout
+        self._batch_interval = batch_interval
 
         self._multicast = multicast
         self._registered_callbacks = {}
+        self._callbacks_tuple = ()
+        self._cb_lock = Lock()
+
+        self._unicast_sock = None
+        self._send_lock = Lock()
+
+        self._subdevice_headers = {}
+        self._subdevice_headers_token = None
 
         self._device_list = {}
         self._device_type = None
@@ -420,7 +552,13 @@ class MotionGateway(MotionCommunication):
         self._protocol_version = None
         self._firmware_version = None
 
-        self._received_multicast_msg = False
+        self._multicast_event = Event()
+
+        self._msg_dispatch = {
+            "Report": self._handle_report,
+            "Heartbeat": self._handle_heartbeat,
+            "GetDeviceListAck": self._handle_device_list_ack,
+        }
 
         if self._multicast is not None:
             self._multicast.Register_motion_gateway(ip, self.multicast_callback)
@@ -441,8 +579,8 @@ class MotionGateway(MotionCommunication):
             )
             return None
 
-        token_bytes = bytes(self._token, "utf-8")
-        key_bytes = bytes(self._key, "utf-8")
+        token_bytes = self._token.encode("utf-8")
+        key_bytes = self._key.encode("utf-8")
 
         cipher = AES.new(key_bytes, AES.MODE_ECB)
         encrypted_bytes = cipher.encrypt(token_bytes)
@@ -450,81 +588,150 @@ class MotionGateway(MotionCommunication):
 
         return self._access_token
 
+    def _get_unicast_socket(self):
+        """Return the UDP socket connected to the Motion Gateway, create it if needed."""
+        if self._unicast_sock is None:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF)
+                s.connect((self._ip, UDP_PORT_SEND))
+            except OSError:
+                s.close()
+                raise
+            self._unicast_sock = s
+
+        return self._unicast_sock
+
+    def _reset_unicast_socket(self, s):
+        """Close a broken UDP socket to the Motion Gateway, such that it is recreated when used again."""
+        with self._send_lock:
+            if s is not None and s is self._unicast_sock:
+                self._unicast_sock = None
+                try:
+                    s.close()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _drain_socket(s):
+        """Discard late responses to previous messages that are still queued on the socket."""
+        s.setblocking(False)
+        try:
+            while True:
+                s.recv(SOCKET_BUFSIZE)
+        except OSError:
+            pass
+
     def _send(self, message, single_response=True):
         """Send a command to the Motion Gateway."""
         attempt = 1
         data = []
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("Sending message: '%s'", log_hide(message))
+            _LOGGER.debug("Sending message: '%s'", LogHide(message))
+
+        if isinstance(message, bytes):
+            payload = message
+        else:
+            payload = json_dumps(message)
 
         while True:
+            deadline = time.monotonic() + self._timeout
+            s = None
             try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.settimeout(self._timeout)
-
-                s.sendto(bytes(json.dumps(message), "utf-8"), (self._ip, UDP_PORT_SEND))
-
-                while True:
-                    single_data, _addr = s.recvfrom(SOCKET_BUFSIZE)
-                    data.append(single_data)
-
-                    if len(single_data) < int(0.9 * MAX_RESPONSE_LENGTH):
-                        break
-
-                    s.settimeout(self._multi_resp_timeout)
-
-                    if single_response:
-                        _LOGGER.error(
-                            "Response of length %i>%i received, while only expecting single response,"
-                            " while sending message '%s', got response: '%s'",
-                            len(single_data),
-                            int(0.9 * MAX_RESPONSE_LENGTH),
-                            log_hide(message),
-                            log_hide(json.loads(single_data)),
-                        )
-                        break
+                # only hold the lock for this attempt, other commands can go in between retries
+                with self._send_lock:
+                    s = self._get_unicast_socket()
+                    self._drain_socket(s)
+                    s.send(payload)
+                    # waiting on the lock does not count for the response timeout
+                    deadline = time.monotonic() + self._timeout
+
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        s.settimeout(remaining)
+                        try:
+                            single_data = s.recv(SOCKET_BUFSIZE)
+                        except socket.timeout:
+                            break
+                        data.append(single_data)
+
+                        if len(single_data) < int(0.9 * MAX_RESPONSE_LENGTH):
+                            break
+
+                        if single_response:
+                            _LOGGER.error(
+                                "Response of length %i>%i received, while only expecting single response,"
+                                " while sending message '%s', got response: '%s'",
+                                len(single_data),
+                                int(0.9 * MAX_RESPONSE_LENGTH),
+                                LogHide(message),
+                                LogHide(json_loads(single_data)),
+                            )
+                            break
+
+                        deadline = time.monotonic() + self._multi_resp_timeout
+            except ConnectionRefusedError:
+                # the connected socket reports ICMP port unreachable right away,
+                # wait out the timeout to give a (rebooting) gateway time to come back
+                _LOGGER.debug(
+                    "Connection refused by gateway at attempt %i while sending message '%s'",
+                    attempt,
+                    LogHide(message),
+                )
+                time.sleep(max(0.0, deadline - time.monotonic()))
+            except OSError as ex:
+                # the socket can be broken (network down, interface change), recreate it at the next attempt
+                _LOGGER.debug(
+                    "Error '%s' on the socket to the gateway at attempt %i while sending message '%s'",
+                    ex,
+                    attempt,
+                    LogHide(message),
+                )
+                self._reset_unicast_socket(s)
+                time.sleep(max(0.0, deadline - time.monotonic()))
 
-                s.close()
+            if len(data) > 0:
                 break
-            except socket.timeout:
-                if len(data) > 0:
-                    s.close()
-                    break
 
-                if attempt >= 3:
-                    _LOGGER.error(
-                        "Timeout of %.1f sec occurred on %i attempts while sending message '%s'",
-                        self._timeout,
-                        attempt,
-                        log_hide(message),
-                    )
-                    s.close()
-                    self._available = False
-                    raise
-                _LOGGER.debug(
-                    "Timeout of %.1f sec occurred at %i attempts while sending message '%s', trying again...",
+            if attempt >= 3:
+                _LOGGER.error(
+                    "Timeout of %.1f sec occurred on %i attempts while sending message '%s'",
                     self._timeout,
                     attempt,
-                    log_hide(message),
+                    LogHide(message),
                 )
-                s.close()
-                attempt += 1
+                self._available = False
+                raise socket.timeout("timed out")
+            _LOGGER.debug(
+                "Timeout of %.1f sec occurred at %i attempts while sending message '%s', trying again...",
+                self._timeout,
+                attempt,
+                LogHide(message),
+            )
+            attempt += 1
+            # give commands that are waiting on the lock a chance to go first
+            time.sleep(0)
 
-        responses = []
-        for d in data:
-            responses.append(json.loads(d))
+        if single_response:
+            # only the first response is used, do not decode the others
+            responses = [json_loads(data[0])]
+        else:
+            responses = [json_loads(d) for d in data]
 
         for response in responses:
             if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug("Received response: '%s'", log_hide(response))
+                _LOGGER.debug("Received response: '%s'", LogHide(response))
 
             if response.get("actionResult") is not None:
                 _LOGGER.error(
                     "Received actionResult: '%s', when sending message: '%s', got response: '%s'",
                     response.get("actionResult"),
-                    log_hide(message),
-                    log_hide(response),
+                    LogHide(message),
+                    LogHide(response),
                 )
                 if response.get("token") is not None:
                     # check for token change
@@ -538,28 +745,49 @@ class MotionGateway(MotionCommunication):
 
         return responses
 
+    def _subdevice_msg(self, msg_type, mac, device_type):
+        """
+        Return the start of a JSON encoded message to a subdevice, without the closing brace.
+
+        The constant header (msgType, mac, deviceType and AccessToken) is only serialized once
+        and reused until the AccessToken changes, only the msgID is added on every call.
+        """
+        access_token = self.access_token
+        if access_token != self._subdevice_headers_token:
+            self._subdevice_headers.clear()
+            self._subdevice_headers_token = access_token
+
+        key = (msg_type, mac, device_type)
+        header = self._subdevice_headers.get(key)
+        if header is None:
+            header = json_dumps(
+                {
+                    "msgType": msg_type,
+                    "mac": mac,
+                    "deviceType": device_type,
+                    "AccessToken": access_token,
+                }
+            )[:-1]
+            self._subdevice_headers[key] = header
+
+        return header + b',"msgID":"' + self._get_timestamp().encode("utf-8") + b'"'
+
     def _read_subdevice(self, mac, device_type):
         """Read the status of a subdevice."""
-        msg = {
-            "msgType": "ReadDevice",
-            "mac": mac,
-            "deviceType": device_type,
-            "AccessToken": self.access_token,
-            "msgID": self._get_timestamp(),
-        }
+        msg = self._subdevice_msg("ReadDevice", mac, device_type) + b"}"
 
         return self._send(msg)
 
     def _write_subdevice(self, mac, device_type, data):
-        """Write a command to a subdevice."""
-        msg = {
-            "msgType": "WriteDevice",
-            "mac": mac,
-            "deviceType": device_type,
-            "AccessToken": self.access_token,
-            "msgID": self._get_timestamp(),
-            "data": data,
-        }
+        """Write a command to a subdevice, data is a dict or already JSON encoded bytes."""
+        if not isinstance(data, bytes):
+            data = json_dumps(data)
+        msg = (
+            self._subdevice_msg("WriteDevice", mac, device_type)
+            + b',"data":'
+            + data
+            + b"}"
+        )
 
         return self._send(msg)
 
@@ -580,13 +808,13 @@ class MotionGateway(MotionCommunication):
         self._available = True
         data = response.get("data")
         if data:
-            try:
-                self._status = GatewayStatus(
-                    data.get("currentState", GatewayStatus.Unknown)
-                )
-            except ValueError:
-                self._status = GatewayStatus.Unknown
+            status = GATEWAY_STATUS_BY_VALUE.get(
+                data.get("currentState", GatewayStatus.Unknown)
+            )
+            if status is None:
+                status = GatewayStatus.Unknown
                 _LOGGER.debug("Gateway returned unknown GatewayStatus %s", data.get("currentState"))
+            self._status = status
             self._N_devices = data.get("numberOfDevices", 0)
             self._RSSI = data.get("RSSI")
 
@@ -622,28 +850,14 @@ class MotionGateway(MotionCommunication):
             device_type = blind["deviceType"]
             if device_type not in DEVICE_TYPES_GATEWAY:
                 blind_mac = blind["mac"]
-                if device_type in [DEVICE_TYPE_BLIND]:
-                    self._device_list[blind_mac] = MotionBlind(
-                        gateway=self, mac=blind_mac, device_type=device_type
-                    )
-                elif device_type in [DEVICE_TYPE_DR]:
-                    self._device_list[blind_mac] = MotionBlind(
-                        gateway=self,
-                        mac=blind_mac,
-                        device_type=device_type,
-                        max_angle=90,
-                    )
-                elif device_type in [DEVICE_TYPE_TDBU]:
-                    self._device_list[blind_mac] = MotionTopDownBottomUp(
-                        gateway=self, mac=blind_mac, device_type=device_type
-                    )
-                elif device_type in [
-                    DEVICE_TYPE_WIFI_BLIND,
-                    DEVICE_TYPE_WIFI_CURTAIN,
-                    DEVICE_TYPE_WIFI_GATE,
-                ]:
-                    self._device_list[blind_mac] = MotionBlind(
-                        gateway=self, mac=blind_mac, device_type=device_type
+                known_blind = self._device_list.get(blind_mac)
+                if known_blind is not None and known_blind.device_type == device_type:
+                    # keep the existing blind with its state and registered callbacks
+                    continue
+                blind_class, kwargs = BLIND_FACTORY.get(device_type, (None, None))
+                if blind_class is not None:
+                    self._device_list[blind_mac] = blind_class(
+                        gateway=self, mac=blind_mac, device_type=device_type, **kwargs
                     )
                 else:
                     _LOGGER.warning(
@@ -659,60 +873,68 @@ class MotionGateway(MotionCommunication):
                 "Received actionResult: '%s', on multicast listener from ip '%s', got response: '%s'",
                 message["actionResult"],
                 self._ip,
-                log_hide(message),
+                LogHide(message),
             )
             return
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("Received multicast message: '%s'", log_hide(message))
+            _LOGGER.debug("Received multicast message: '%s'", LogHide(message))
 
         msgType = message.get("msgType")
-        mac = message.get("mac")
-        if msgType == "Report":
-            if mac == self._gateway_mac:
-                self._parse_update_response(message)
-                for callback in self._registered_callbacks.values():
-                    callback()
-            if mac not in self.device_list:
-                if self.device_list and mac != self._gateway_mac:
-                    _LOGGER.warning(
-                        "Multicast push with mac '%s' not in device_list, message: '%s'",
-                        mac,
-                        log_hide(message),
-                    )
-                return
-            self.device_list[mac].multicast_callback(message)
-        elif msgType == "Heartbeat":
-            if mac != self._gateway_mac and self._gateway_mac is not None:
-                _LOGGER.warning(
-                    "Multicast Heartbeat with mac '%s' does not agree with gateway mac '%s', message: '%s'",
-                    mac,
-                    self._gateway_mac,
-                    log_hide(message),
-                )
-                return
+        handler = self._msg_dispatch.get(msgType)
+        if handler is None:
+            _LOGGER.warning(
+                "Unknown msgType '%s' received from multicast push with message: '%s'",
+                msgType,
+                LogHide(message),
+            )
+            return
+
+        handler(message, message.get("mac"))
+
+    def _handle_report(self, message, mac):
+        """Process a multicast Report of the gateway or one of its blinds."""
+        if mac == self._gateway_mac:
             self._parse_update_response(message)
-            for callback in self._registered_callbacks.values():
+            for callback in self._callbacks_tuple:
                 callback()
-        elif msgType == "GetDeviceListAck":
-            if mac != self._gateway_mac and self._gateway_mac is not None:
+        if mac not in self.device_list:
+            if self.device_list and mac != self._gateway_mac:
                 _LOGGER.warning(
-                    "Multicast GetDeviceListAck with mac '%s' does not agree with gateway mac '%s', message: '%s'",
+                    "Multicast push with mac '%s' not in device_list, message: '%s'",
                     mac,
-                    self._gateway_mac,
-                    log_hide(message),
+                    LogHide(message),
                 )
-                return
-            self._parse_device_list_response(message)
-            for callback in self._registered_callbacks.values():
-                callback()
-        else:
+            return
+        self.device_list[mac].multicast_callback(message)
+
+    def _handle_heartbeat(self, message, mac):
+        """Process a multicast Heartbeat of the gateway."""
+        if mac != self._gateway_mac and self._gateway_mac is not None:
             _LOGGER.warning(
-                "Unknown msgType '%s' received from multicast push with message: '%s'",
-                msgType,
-                log_hide(message),
+                "Multicast Heartbeat with mac '%s' does not agree with gateway mac '%s', message: '%s'",
+                mac,
+                self._gateway_mac,
+                LogHide(message),
+            )
+            return
+        self._parse_update_response(message)
+        for callback in self._callbacks_tuple:
+            callback()
+
+    def _handle_device_list_ack(self, message, mac):
+        """Process a multicast GetDeviceListAck of the gateway."""
+        if mac != self._gateway_mac and self._gateway_mac is not None:
+            _LOGGER.warning(
+                "Multicast GetDeviceListAck with mac '%s' does not agree with gateway mac '%s', message: '%s'",
+                mac,
+                self._gateway_mac,
+                LogHide(message),
             )
             return
+        self._parse_device_list_response(message)
+        for callback in self._callbacks_tuple:
+            callback()
 
     def GetDeviceList(self):
         """Get the device list from the Motion Gateway."""
@@ -779,6 +1001,166 @@ class MotionGateway(MotionCommunication):
         # parse response
         self._parse_update_response(response)
 
+    @staticmethod
+    def _raw_mac(data, nbytes):
+        """Return the "mac" value of a raw JSON message in the first nbytes of data as bytes, or None if it has none."""
+        key = data.find(b'"mac"', 0, nbytes)
+        if key < 0:
+            return None
+        start = data.find(b'"', key + 5, nbytes) + 1
+        end = data.find(b'"', start, nbytes)
+        if start <= 0 or end < 0:
+            return None
+        return bytes(data[start:end])
+
+    def _receive_mcast_report(self, mcast_socket, pending, mcast_buf):
+        """
+        Receive one multicast push into mcast_buf and check if it is a status report of one of the pending blinds.
+
+        pending maps the mac bytes of each blind to the blind itself.
+        Returns the blind and its report, or None if the push is not a status report of a pending blind.
+        """
+        nbytes, (ip, _) = mcast_socket.recvfrom_into(mcast_buf)
+
+        # check ip
+        if ip != self._ip:
+            _LOGGER.debug(
+                "Received multicast push from a diffrent gateway with ip '%s', in Update function",
+                ip,
+            )
+            return None
+
+        # route on the raw mac value, skips decoding pushes of other blinds
+        blind = pending.get(self._raw_mac(mcast_buf, nbytes))
+        if blind is None:
+            return None
+
+        try:
+            mcast_response = json_loads(memoryview(mcast_buf)[:nbytes])
+        except ValueError:
+            _LOGGER.debug("Cannot parse multicast message: '%s'", LogHide(bytes(mcast_buf[:nbytes])))
+            return None
+
+        # check mac
+        if mcast_response.get("mac") != blind.mac:
+            _LOGGER.debug(
+                "Received multicast push regarding a diffrent blind with mac '%s', in Update function",
+                mcast_response.get("mac"),
+            )
+            return None
+
+        # check actionResult
+        if mcast_response.get("actionResult") is not None:
+            _LOGGER.error(
+                "Received actionResult: '%s' from multicast push within Update function",
+                mcast_response.get("actionResult"),
+            )
+            return None
+
+        # check msgType
+        msgType = mcast_response.get("msgType")
+        if msgType != "Report":
+            _LOGGER.debug(
+                "Response to update on multicast is not a Report but '%s'.",
+                msgType,
+            )
+            return None
+
+        return blind, mcast_response
+
+    def _wait_on_mcast_reports(self, mcast_socket, pending, deadline, mcast_buf):
+        """
+        Parse status reports from the multicast socket into the pending blinds.
+
+        pending maps the mac bytes of each blind to the blind itself, blinds are removed once their report is parsed.
+        Returns when all pending blinds reported or the deadline passed, mcast_buf is reused to receive the pushes.
+        """
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            mcast_socket.settimeout(remaining)
+            try:
+                received = self._receive_mcast_report(mcast_socket, pending, mcast_buf)
+            except socket.timeout:
+                return
+            if received is None:
+                continue
+
+            blind, mcast_response = received
+            blind._parse_response(mcast_response)
+            del pending[blind._mac_bytes]
+
+    def Update_blinds(self, blinds=None):
+        """
+        Get the status of multiple blinds from the blinds through the Motion Gateway.
+
+        The status of all blinds is requested at once and the multicast pushes with the new status are awaited together,
+        such that updating multiple blinds takes at most one multicast timeout per attempt instead of one per blind.
+        If no blinds are given, all blinds in the device_list are updated.
+        """
+        if blinds is None:
+            blinds = list(self.device_list.values())
+
+        pending = {}
+        for blind in blinds:
+            if blind._wireless_mode == WirelessMode.UniDirection:
+                # UniDirection blinds cannot send their state, so do not wait on multicast
+                blind.Update_trigger()
+            else:
+                pending[blind._mac_bytes] = blind
+
+        if not pending:
+            return
+
+        mcast = None
+        mcast_buf = None
+        if self._multicast is None:
+            # one socket and buffer for all blinds and attempts, closed once the update is finished
+            mcast = self._create_mcast_socket("any", False)
+            mcast_buf = bytearray(SOCKET_BUFSIZE)
+
+        try:
+            attempt = 1
+            while True:
+                # send update requests
+                for blind in pending.values():
+                    blind._report_event.clear()
+                    blind.Update_trigger()
+
+                # wait on multicast pushes for new status
+                deadline = time.monotonic() + self._mcast_timeout
+                if mcast is not None:
+                    self._wait_on_mcast_reports(mcast, pending, deadline, mcast_buf)
+                else:
+                    for mac_bytes, blind in list(pending.items()):
+                        if blind._report_event.wait(max(deadline - time.monotonic(), 0.0)):
+                            del pending[mac_bytes]
+
+                if not pending:
+                    return
+
+                if attempt >= 5:
+                    _LOGGER.error(
+                        "Timeout of %.1f sec occurred on %i attempts while waiting on multicast push from update request of blinds '%s', communication between gateway and blinds might be bad.",
+                        self._mcast_timeout,
+                        attempt,
+                        ", ".join(blind.mac for blind in pending.values()),
+                    )
+                    for blind in pending.values():
+                        blind._available = False
+                    raise socket.timeout("timed out")
+                _LOGGER.debug(
+                    "Timeout of %.1f sec occurred at %i attempts while waiting on multicast push from update request of blinds '%s', trying again...",
+                    self._mcast_timeout,
+                    attempt,
+                    ", ".join(blind.mac for blind in pending.values()),
+                )
+                attempt += 1
+        finally:
+            if mcast is not None:
+                mcast.close()
+
     def Check_gateway_multicast(self):
         """Trigger a multicast message from the gateway by issuing a GetDeviceList over multicast and check if the response is received."""
         if self._multicast is None:
@@ -787,10 +1169,10 @@ class MotionGateway(MotionCommunication):
             )
             return False
 
-        self._received_multicast_msg = False
+        self._multicast_event.clear()
 
         def check_multicast_callback():
-            self._received_multicast_msg = True
+            self._multicast_event.set()
 
         self.Register_callback("Check_gateway_multicast", check_multicast_callback)
 
@@ -809,35 +1191,42 @@ class MotionGateway(MotionCommunication):
             blind.Update_trigger()
 
         # Wait untill callback received
-        start = datetime.datetime.utcnow()
-        while True:
-            if self._received_multicast_msg:
-                break
-            time_past = datetime.datetime.utcnow() - start
-            if time_past.total_seconds() > self._mcast_timeout:
-                break
+        received_multicast_msg = self._multicast_event.wait(self._mcast_timeout)
 
         self.Remove_callback("Check_gateway_multicast")
         for blind in self.device_list.values():
             blind.Remove_callback("Check_blind_multicast")
-        return self._received_multicast_msg
+        return received_multicast_msg
+
+    def Close_socket(self):
+        """Close the UDP socket used to send commands to the Motion Gateway."""
+        with self._send_lock:
+            if self._unicast_sock is not None:
+                self._unicast_sock.close()
+                self._unicast_sock = None
 
     def Register_callback(self, cb_id, callback):
         """Register a external callback function for updates of the gateway."""
-        if cb_id in self._registered_callbacks:
-            _LOGGER.error(
-                "A callback with id '%s' was already registed, overwriting previous callback",
-                cb_id,
-            )
-        self._registered_callbacks[cb_id] = callback
+        with self._cb_lock:
+            if cb_id in self._registered_callbacks:
+                _LOGGER.error(
+                    "A callback with id '%s' was already registed, overwriting previous callback",
+                    cb_id,
+                )
+            self._registered_callbacks[cb_id] = callback
+            self._callbacks_tuple = tuple(self._registered_callbacks.values())
 
     def Remove_callback(self, cb_id):
         """Remove a external callback using its id."""
-        self._registered_callbacks.pop(cb_id)
+        with self._cb_lock:
+            self._registered_callbacks.pop(cb_id)
+            self._callbacks_tuple = tuple(self._registered_callbacks.values())
 
     def Clear_callbacks(self):
         """Remove all external registered callbacks for updates of the gateway."""
-        self._registered_callbacks.clear()
+        with self._cb_lock:
+            self._registered_callbacks.clear()
+            self._callbacks_tuple = ()
 
     @property
     def available(self):
@@ -931,7 +1320,46 @@ class MotionGateway(MotionCommunication):
 class MotionBlind:
     """Sub class representing a blind connected to the Motion Gateway."""
 
-    QUERY_DATA = {"operation": 5}
+    __slots__ = (
+        "_gateway",
+        "_mac",
+        "_mac_bytes",
+        "_device_type",
+        "_blind_type",
+        "_wireless_mode",
+        "_voltage_mode",
+        "_max_angle",
+        "_angle_to_user",
+        "_angle_to_device",
+        "_registered_callbacks",
+        "_callbacks_tuple",
+        "_cb_lock",
+        "_last_status_report_ts",
+        "_report_event",
+        "_pending_data",
+        "_pending_lock",
+        "_status",
+        "_available",
+        "_limit_status",
+        "_position",
+        "_angle",
+        "_restore_angle",
+        "_battery_voltage",
+        "_battery_level",
+        "_is_charging",
+        "_RSSI",
+        "__weakref__",
+    )
+
+    # fixed command payloads, JSON encoded once
+    QUERY_DATA = json_dumps({"operation": 5})
+    STOP_DATA = json_dumps({"operation": 2})
+    OPEN_DATA = json_dumps({"operation": 1})
+    CLOSE_DATA = json_dumps({"operation": 0})
+    JOG_UP_DATA = json_dumps({"operation": 7})
+    JOG_DOWN_DATA = json_dumps({"operation": 8})
+    SET_FAVORITE_DATA = json_dumps({"operation": 11})
+    GO_FAVORITE_DATA = json_dumps({"operation": 12})
 
     def __init__(
         self,
@@ -942,14 +1370,22 @@ class MotionBlind:
     ):
         self._gateway = gateway
         self._mac = mac
+        self._mac_bytes = mac.encode("utf-8") if mac is not None else b""
         self._device_type = device_type
         self._blind_type = None
         self._wireless_mode = None
         self._voltage_mode = None
         self._max_angle = max_angle
+        self._angle_to_user = 180.0 / max_angle
+        self._angle_to_device = max_angle / 180.0
 
         self._registered_callbacks = {}
-        self._last_status_report = datetime.datetime.utcnow()
+        self._callbacks_tuple = ()
+        self._cb_lock = Lock()
+        self._last_status_report_ts = time.time()
+        self._report_event = Event()
+        self._pending_data = None
+        self._pending_lock = Lock()
 
         self._status = None
         self._available = False
@@ -992,96 +1428,91 @@ class MotionBlind:
 
         return response
 
-    def _wait_on_mcast_report(self, mcast_socket):
-        """Wait untill a status report is received from the multicast socket"""
-        while True:
-            try:
-                mcast_data, (ip, _) = mcast_socket.recvfrom(SOCKET_BUFSIZE)
-                mcast_response = json.loads(mcast_data)
+    def _drop_pending(self):
+        """Drop the batched commands that are not yet written, a direct command overrules them."""
+        with self._pending_lock:
+            self._pending_data = None
 
-                # check ip
-                if ip != self._gateway._ip:
-                    _LOGGER.debug(
-                        "Received multicast push from a diffrent gateway with ip '%s', in Update function",
-                        ip,
-                    )
-                    continue
+    def _write_batched(self, data):
+        """
+        Write a position/angle command to control the blind.
 
-                # check mac
-                if mcast_response.get("mac") != self.mac:
-                    _LOGGER.debug(
-                        "Received multicast push regarding a diffrent blind with mac '%s', in Update function",
-                        mcast_response.get("mac"),
-                    )
-                    continue
+        If the gateway has a batch_interval, the command is not sent directly,
+        but merged with the other commands to this blind within that interval and sent as one write.
+        """
+        batch_interval = self._gateway._batch_interval
+        if batch_interval <= 0:
+            response = self._write(data)
+            self._parse_response(response)
+            return
 
-                # check actionResult
-                if mcast_response.get("actionResult") is not None:
-                    _LOGGER.error(
-                        "Received actionResult: '%s' from multicast push within Update function",
-                        mcast_response.get("actionResult"),
-                    )
-                    continue
+        with self._pending_lock:
+            if self._pending_data is not None:
+                # later commands overwrite the keys of earlier ones
+                self._pending_data.update(data)
+                return
+            self._pending_data = dict(data)
+
+        timer = Timer(batch_interval, self._write_pending)
+        timer.daemon = True
+        timer.start()
+
+    def _write_pending(self):
+        """Write the merged batched commands to the blind."""
+        # keep the lock while writing, so a direct command is not overtaken by this write
+        with self._pending_lock:
+            data = self._pending_data
+            self._pending_data = None
+            if data is None:
+                # dropped by a direct command
+                return
 
-                # check msgType
-                msgType = mcast_response.get("msgType")
-                if msgType != "Report":
-                    _LOGGER.debug(
-                        "Response to update on multicast is not a Report but '%s'.",
-                        msgType,
-                    )
-                    continue
+            try:
+                response = self._write(data)
+                self._parse_response(response)
+            except (OSError, ParseException) as ex:
+                _LOGGER.error(
+                    "Device with mac '%s' failed to write batched command '%s': %s",
+                    self.mac,
+                    data,
+                    ex,
+                )
 
-                # done
-                mcast_socket.close()
-                return mcast_response
-            except socket.timeout:
-                mcast_socket.close()
-                raise
+    def _wait_on_mcast_report(self, mcast_socket, mcast_buf):
+        """Wait until a status report is received from the multicast socket, the socket is not closed."""
+        # pushes of other blinds should not extend the total waiting time
+        deadline = time.monotonic() + self._gateway._mcast_timeout
+        pending = {self._mac_bytes: self}
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
+            mcast_socket.settimeout(remaining)
+            received = self._gateway._receive_mcast_report(mcast_socket, pending, mcast_buf)
+            if received is not None:
+                return received[1]
 
     @staticmethod
     def _calculate_battery_level(voltage):
-        if 0.0 < voltage <= 9.4:
-            # 2 cel battery pack (8.4V)
-            return round((voltage - 6.2) * 100 / (8.4 - 6.2), 0)
-
-        if 9.4 < voltage <= 13.6:
-            # 3 cel battery pack (12.6V)
-            # Motion Blinds specs: 10.4-12.6V
-            # Tested: 10.27-12.34V
-            return round((voltage - 10.27) * 100 / (12.34 - 10.27), 0)
+        if voltage <= 0.0:
+            return 0.0
 
-        if 13.6 < voltage <= 19.0:
-            # 4 cel battery pack (16.8V)
-            return round((voltage - 14.6) * 100 / (16.8 - 14.6), 0)
+        for max_voltage, empty_voltage, scale in BATTERY_SEGMENTS:
+            if voltage <= max_voltage:
+                return round((voltage - empty_voltage) * scale, 0)
 
         if voltage >= 100.0:
             # AC motor
             return None
 
-        if voltage <= 0.0:
-            return 0.0
-
         return 200.0
 
     def _parse_response_common(self, response):
         """Parse the common part of a response form the blind."""
 
-        # Check for actionResult (errors)
-        if response.get("actionResult") is not None:
-            # Error already logged in _send function
-            return False
-
         # check device_type
         device_type = response.get("deviceType", self._device_type)
-        if device_type not in [
-            DEVICE_TYPE_BLIND,
-            DEVICE_TYPE_TDBU,
-            DEVICE_TYPE_DR,
-            DEVICE_TYPE_WIFI_BLIND,
-            DEVICE_TYPE_WIFI_CURTAIN,
-            DEVICE_TYPE_WIFI_GATE,
-        ]:
+        if device_type not in DEVICE_TYPES_BLIND:
             _LOGGER.warning(
                 "Device with mac '%s' has DeviceType '%s' that does not correspond to a known blind in Update function.",
                 self.mac,
@@ -1091,8 +1522,9 @@ class MotionBlind:
         # update variables
         self._mac = response.get("mac", self._mac)
         self._device_type = device_type
+        data = response.get("data", {})
         try:
-            self._blind_type = BlindType(response["data"]["type"])
+            value = data["type"]
         except KeyError:
             if self._blind_type is None:
                 _LOGGER.info(
@@ -1100,116 +1532,138 @@ class MotionBlind:
                     self.mac,
                 )
                 self._blind_type = BlindType.RollerBlind
-        except ValueError:
-            if self._blind_type != BlindType.Unknown:
-                _LOGGER.error(
-                    "Device with mac '%s' has blind_type '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                    self.mac,
-                    response["data"]["type"],
-                )
-            self._blind_type = BlindType.Unknown
+        else:
+            blind_type = BLIND_TYPE_BY_VALUE.get(value)
+            if blind_type is None:
+                if self._blind_type != BlindType.Unknown:
+                    _LOGGER.error(
+                        "Device with mac '%s' has blind_type '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                        self.mac,
+                        value,
+                    )
+                blind_type = BlindType.Unknown
+            self._blind_type = blind_type
 
         try:
-            self._wireless_mode = WirelessMode(response["data"]["wirelessMode"])
+            value = data["wirelessMode"]
         except KeyError:
             pass
-        except ValueError:
-            if self._wireless_mode != WirelessMode.Unknown:
-                _LOGGER.error(
-                    "Device with mac '%s' has wireless_mode '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                    self.mac,
-                    response["data"].get("wirelessMode"),
-                )
-            self._wireless_mode = WirelessMode.Unknown
+        else:
+            wireless_mode = WIRELESS_MODE_BY_VALUE.get(value)
+            if wireless_mode is None:
+                if self._wireless_mode != WirelessMode.Unknown:
+                    _LOGGER.error(
+                        "Device with mac '%s' has wireless_mode '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                        self.mac,
+                        value,
+                    )
+                wireless_mode = WirelessMode.Unknown
+            self._wireless_mode = wireless_mode
 
         try:
-            self._voltage_mode = VoltageMode(response["data"]["voltageMode"])
+            value = data["voltageMode"]
         except KeyError:
             pass
-        except ValueError:
-            if self._voltage_mode != VoltageMode.Unknown:
-                _LOGGER.error(
-                    "Device with mac '%s' has voltage_mode '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                    self.mac,
-                    response["data"].get("voltageMode"),
-                )
-            self._voltage_mode = VoltageMode.Unknown
+        else:
+            voltage_mode = VOLTAGE_MODE_BY_VALUE.get(value)
+            if voltage_mode is None:
+                if self._voltage_mode != VoltageMode.Unknown:
+                    _LOGGER.error(
+                        "Device with mac '%s' has voltage_mode '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                        self.mac,
+                        value,
+                    )
+                voltage_mode = VoltageMode.Unknown
+            self._voltage_mode = voltage_mode
 
         # Check max angle
         if self._blind_type in [BlindType.ShangriLaBlind]:
             self._max_angle = 90
+            self._angle_to_user = 180.0 / 90
+            self._angle_to_device = 90 / 180.0
 
         self._available = True
 
         if self._wireless_mode == WirelessMode.UniDirection:
-            return True
+            return
 
         try:
-            self._RSSI = response["data"]["RSSI"]
+            self._RSSI = data["RSSI"]
         except KeyError:
             pass
 
         try:
-            self._is_charging = response["data"]["chargingState"]
+            self._is_charging = data["chargingState"]
         except KeyError:
             pass
 
-        return True
-
     def _parse_response(self, response):
         """Parse a response form the blind."""
+        # Check for actionResult (errors)
+        if response.get("actionResult") is not None:
+            # Error already logged in _send function
+            return
+
         try:
             # handle the part that is common among all blinds
-            if not self._parse_response_common(response):
-                return
+            self._parse_response_common(response)
+
+            data = response.get("data", {})
 
             # handle specific properties
             try:
-                self._status = BlindStatus(response["data"]["operation"])
+                value = data["operation"]
             except KeyError:
                 self._status = BlindStatus.Unknown
-            except ValueError:
-                if self._status != BlindStatus.Unknown:
-                    _LOGGER.error(
-                        "Device with mac '%s' has status '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                        self.mac,
-                        response["data"]["operation"],
-                    )
-                self._status = BlindStatus.Unknown
+            else:
+                status = BLIND_STATUS_BY_VALUE.get(value)
+                if status is None:
+                    if self._status != BlindStatus.Unknown:
+                        _LOGGER.error(
+                            "Device with mac '%s' has status '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                            self.mac,
+                            value,
+                        )
+                    status = BlindStatus.Unknown
+                self._status = status
 
             if self._wireless_mode == WirelessMode.UniDirection:
                 return
 
             try:
-                self._limit_status = LimitStatus(response["data"]["currentState"])
+                value = data["currentState"]
             except KeyError:
                 self._limit_status = LimitStatus.Unknown
-            except ValueError:
-                if self._limit_status != LimitStatus.Unknown:
-                    _LOGGER.error(
-                        "Device with mac '%s' has limit_status '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                        self.mac,
-                        response["data"]["currentState"],
-                    )
-                self._status = LimitStatus.Unknown
+            else:
+                limit_status = LIMIT_STATUS_BY_VALUE.get(value)
+                if limit_status is None:
+                    if self._limit_status != LimitStatus.Unknown:
+                        _LOGGER.error(
+                            "Device with mac '%s' has limit_status '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                            self.mac,
+                            value,
+                        )
+                    limit_status = LimitStatus.Unknown
+                self._limit_status = limit_status
 
             try:
-                self._battery_voltage = response["data"]["batteryLevel"] / 100.0
+                self._battery_voltage = data["batteryLevel"] / 100.0
             except KeyError:
                 self._battery_voltage = None
             else:
                 self._battery_level = self._calculate_battery_level(
                     self._battery_voltage
                 )
-                if self._voltage_mode != VoltageMode.AC and (
-                    self._battery_level is None or self._battery_voltage <= 0.0 or self._battery_level >= 200.0
-                ):
-                    _LOGGER.debug(
-                        "Device with mac '%s' reported voltage '%s' outside of expected limits, got raw voltage: '%s'",
-                        self.mac,
-                        self._battery_voltage,
-                        response["data"]["batteryLevel"],
-                    )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    if self._voltage_mode != VoltageMode.AC and (
+                        self._battery_level is None or self._battery_voltage <= 0.0 or self._battery_level >= 200.0
+                    ):
+                        _LOGGER.debug(
+                            "Device with mac '%s' reported voltage '%s' outside of expected limits, got raw voltage: '%s'",
+                            self.mac,
+                            self._battery_voltage,
+                            data["batteryLevel"],
+                        )
 
             if self._wireless_mode == WirelessMode.BiDirectionLimits:
                 return
@@ -1226,15 +1680,17 @@ class MotionBlind:
                 )
                 return
 
-            self._position = response["data"].get("currentPosition", 1)
-            self._angle = response["data"].get("currentAngle", 0) * (180.0 / self._max_angle)
+            # a bidirectional blind has to report data, raise if it is missing
+            data = response["data"]
+            self._position = data.get("currentPosition", 1)
+            self._angle = data.get("currentAngle", 0) * self._angle_to_user
             if self._angle != 0:
                 self._restore_angle = self._angle
         except (KeyError, ValueError) as ex:
             _LOGGER.exception(
                 "Device with mac '%s' send an response with unexpected data, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues. Response: '%s'",
                 self.mac,
-                log_hide(response),
+                LogHide(response),
             )
             raise ParseException(
                 f"Got an exception while parsing response: {log_hide(response)}"
@@ -1245,9 +1701,10 @@ class MotionBlind:
         self._parse_response(message)
 
         if message.get("msgType") == "Report":
-            self._last_status_report = datetime.datetime.utcnow()
+            self._last_status_report_ts = time.time()
+            self._report_event.set()
 
-        for callback in self._registered_callbacks.values():
+        for callback in self._callbacks_tuple:
             callback()
 
     def Update_from_cache(self):
@@ -1295,69 +1752,69 @@ class MotionBlind:
             self.Update_trigger()
             return
 
-        attempt = 1
-        while True:
-            if self._gateway._multicast is None:
-                mcast = self._gateway._create_mcast_socket("any", False)
-                mcast.settimeout(self._gateway._mcast_timeout)
-
-            # send update request
-            self.Update_trigger()
-
-            # wait on multicast push for new status
-            try:
-                if self._gateway._multicast is None:
-                    mcast_response = self._wait_on_mcast_report(mcast)
+        mcast = None
+        mcast_buf = None
+        if self._gateway._multicast is None:
+            # one socket for all attempts, closed once the update is finished
+            mcast = self._gateway._create_mcast_socket("any", False)
+            # per call, such that overlapping updates of this blind do not share a buffer
+            mcast_buf = bytearray(SOCKET_BUFSIZE)
 
-                    self._parse_response(mcast_response)
-                    break
-
-                start = datetime.datetime.utcnow()
-                while True:
-                    time_diff = self._last_status_report - start
-                    if time_diff.total_seconds() > 0:
+        try:
+            attempt = 1
+            while True:
+                # send update request
+                self._report_event.clear()
+                self.Update_trigger()
+
+                # wait on multicast push for new status
+                try:
+                    if mcast is not None:
+                        mcast_response = self._wait_on_mcast_report(mcast, mcast_buf)
+
+                        self._parse_response(mcast_response)
                         break
-                    time_past = datetime.datetime.utcnow() - start
-                    if time_past.total_seconds() > self._gateway._mcast_timeout:
+
+                    if not self._report_event.wait(self._gateway._mcast_timeout):
                         raise socket.timeout
-                break
-            except socket.timeout:
-                if attempt >= 5:
-                    _LOGGER.error(
-                        "Timeout of %.1f sec occurred on %i attempts while waiting on multicast push from update request, communication between gateway and blind might be bad.",
+                    break
+                except socket.timeout:
+                    if attempt >= 5:
+                        _LOGGER.error(
+                            "Timeout of %.1f sec occurred on %i attempts while waiting on multicast push from update request, communication between gateway and blind might be bad.",
+                            self._gateway._mcast_timeout,
+                            attempt,
+                        )
+                        self._available = False
+                        raise
+                    _LOGGER.debug(
+                        "Timeout of %.1f sec occurred at %i attempts while waiting on multicast push from update request, trying again...",
                         self._gateway._mcast_timeout,
                         attempt,
                     )
-                    self._available = False
-                    raise
-                _LOGGER.debug(
-                    "Timeout of %.1f sec occurred at %i attempts while waiting on multicast push from update request, trying again...",
-                    self._gateway._mcast_timeout,
-                    attempt,
-                )
-                attempt += 1
+                    attempt += 1
+        finally:
+            if mcast is not None:
+                mcast.close()
 
     def Stop(self):
         """Stop the motion of the blind."""
-        data = {"operation": 2}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.STOP_DATA)
 
         self._parse_response(response)
 
     def Open(self):
         """Open the blind/move the blind up."""
-        data = {"operation": 1}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.OPEN_DATA)
 
         self._parse_response(response)
 
     def Close(self):
         """Close the blind/move the blind down."""
-        data = {"operation": 0}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.CLOSE_DATA)
 
         self._parse_response(response)
 
@@ -1373,15 +1830,13 @@ class MotionBlind:
         """
         data = {"targetPosition": position}
         if restore_angle and self._restore_angle is not None and position != 0:
-            target_angle = round(self._restore_angle * self._max_angle / 180.0, 0)
+            target_angle = round(self._restore_angle * self._angle_to_device, 0)
             data["targetAngle"] = target_angle
         if angle is not None:
-            target_angle = round(angle * self._max_angle / 180.0, 0)
+            target_angle = round(angle * self._angle_to_device, 0)
             data["targetAngle"] = target_angle
 
-        response = self._write(data)
-
-        self._parse_response(response)
+        self._write_batched(data)
 
     def Set_angle(self, angle):
         """
@@ -1389,27 +1844,23 @@ class MotionBlind:
 
         angle is in degrees, so 0-180
         """
-        target_angle = round(angle * self._max_angle / 180.0, 0)
+        target_angle = round(angle * self._angle_to_device, 0)
 
         data = {"targetAngle": target_angle}
 
-        response = self._write(data)
-
-        self._parse_response(response)
+        self._write_batched(data)
 
     def Jog_up(self):
         """Open the blind/move the blind one step up."""
-        data = {"operation": 7}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.JOG_UP_DATA)
 
         self._parse_response(response)
 
     def Jog_down(self):
         """Close the blind/move the blind one step down."""
-        data = {"operation": 8}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.JOG_DOWN_DATA)
 
         self._parse_response(response)
 
@@ -1420,36 +1871,40 @@ class MotionBlind:
         First the blind needs to be put in configuration mode (stepping up/down).
         This is done by shortly pressing the reset button on the physical device.
         """
-        data = {"operation": 11}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.SET_FAVORITE_DATA)
 
         self._parse_response(response)
 
     def Go_favorite_position(self):
         """Move the blind to the favorite position."""
-        data = {"operation": 12}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.GO_FAVORITE_DATA)
 
         self._parse_response(response)
 
     def Register_callback(self, cb_id, callback):
         """Register a external callback function for updates of this blind."""
-        if cb_id in self._registered_callbacks:
-            _LOGGER.error(
-                "A callback with id '%s' was already registed, overwriting previous callback",
-                cb_id,
-            )
-        self._registered_callbacks[cb_id] = callback
+        with self._cb_lock:
+            if cb_id in self._registered_callbacks:
+                _LOGGER.error(
+                    "A callback with id '%s' was already registed, overwriting previous callback",
+                    cb_id,
+                )
+            self._registered_callbacks[cb_id] = callback
+            self._callbacks_tuple = tuple(self._registered_callbacks.values())
 
     def Remove_callback(self, cb_id):
         """Remove a external callback using its id."""
-        self._registered_callbacks.pop(cb_id)
+        with self._cb_lock:
+            self._registered_callbacks.pop(cb_id)
+            self._callbacks_tuple = tuple(self._registered_callbacks.values())
 
     def Clear_callbacks(self):
         """Remove all external registered callbacks for updates of this blind."""
-        self._registered_callbacks.clear()
+        with self._cb_lock:
+            self._registered_callbacks.clear()
+            self._callbacks_tuple = ()
 
     @property
     def device_type(self):
@@ -1559,11 +2014,66 @@ class MotionBlind:
         """Return the radio connection strength of the blind to the gateway in dBm."""
         return self._RSSI
 
+    @property
+    def last_status_report(self):
+        """Return the UTC time of the last status report received over multicast."""
+        return datetime.datetime.fromtimestamp(
+            self._last_status_report_ts, datetime.timezone.utc
+        ).replace(tzinfo=None)
+
 
 class MotionTopDownBottomUp(MotionBlind):
     """Sub class representing a Top Down Bottom Up blind connected to the Motion Gateway."""
 
-    QUERY_DATA = {"operation_T": 5, "operation_B": 5}
+    __slots__ = ("_width", "_scaled_position", "_status_names", "_limit_status_names")
+
+    # fixed command payloads, JSON encoded once
+    QUERY_DATA = json_dumps({"operation_T": 5, "operation_B": 5})
+    SET_FAVORITE_DATA = json_dumps({"operation_B": 11, "operation_T": 11})
+    GO_FAVORITE_DATA = json_dumps({"operation_B": 12, "operation_T": 12})
+    # per motor: "T" (top), "B" (bottom) or "C" (combined)
+    MOTOR_STOP_DATA = {
+        "B": json_dumps({"operation_B": 2}),
+        "T": json_dumps({"operation_T": 2}),
+        "C": json_dumps({"operation_B": 2, "operation_T": 2}),
+    }
+    MOTOR_OPEN_DATA = {
+        "B": json_dumps({"targetPosition_B": 0}),
+        "T": json_dumps({"targetPosition_T": 0}),
+        "C": json_dumps({"targetPosition_B": 0, "targetPosition_T": 0}),
+    }
+    MOTOR_CLOSE_DATA = {
+        "B": json_dumps({"targetPosition_B": 100}),
+        "T": json_dumps({"targetPosition_T": 100}),
+        "C": json_dumps({"targetPosition_B": 100, "targetPosition_T": 0}),
+    }
+    MOTOR_JOG_UP_DATA = {
+        "B": json_dumps({"operation_B": 7}),
+        "T": json_dumps({"operation_T": 7}),
+        "C": json_dumps({"operation_B": 7, "operation_T": 7}),
+    }
+    MOTOR_JOG_DOWN_DATA = {
+        "B": json_dumps({"operation_B": 8}),
+        "T": json_dumps({"operation_T": 8}),
+        "C": json_dumps({"operation_B": 8, "operation_T": 8}),
+    }
+    # payload keys of commands that send the same value to each selected motor
+    MOTOR_ANGLE_KEYS = {
+        "B": ("targetAngle_B",),
+        "T": ("targetAngle_T",),
+        "C": ("targetAngle_B", "targetAngle_T"),
+    }
+    # the Triangle blind opens and closes using operations instead of target positions
+    TRIANGLE_OPEN_DATA = {
+        "B": json_dumps({"operation_B": 1}),
+        "T": json_dumps({"operation_T": 1}),
+        "C": json_dumps({"operation_B": 1, "operation_T": 1}),
+    }
+    TRIANGLE_CLOSE_DATA = {
+        "B": json_dumps({"operation_B": 0}),
+        "T": json_dumps({"operation_T": 0}),
+        "C": json_dumps({"operation_B": 0, "operation_T": 0}),
+    }
 
     def __init__(
         self,
@@ -1574,6 +2084,11 @@ class MotionTopDownBottomUp(MotionBlind):
     ):
         super().__init__(gateway, mac, device_type, max_angle)
         self._position = {"T": 0, "B": 0, "C": 0}
+        # derived from _position, computed on first use after the position changed
+        self._width = None
+        self._scaled_position = None
+        self._status_names = None
+        self._limit_status_names = None
         self._battery_voltage = {"T": None, "B": None}
         self._battery_level = {"T": None, "B": None}
 
@@ -1584,60 +2099,90 @@ class MotionTopDownBottomUp(MotionBlind):
             f"limit: {self.limit_status}, battery: {self.voltage_name}, {self.battery_level} %, {self.battery_voltage} V, charging: {self.is_charging}, RSSI: {self.RSSI} dBm, com: {self.wireless_name}>"
         )
 
+    def _set_position(self, pos_T, pos_B):
+        """Store a new position, the cached width and scaled_position are recomputed on their next use."""
+        self._position = {"T": pos_T, "B": pos_B, "C": (pos_T + pos_B) / 2.0}
+        self._width = None
+        self._scaled_position = None
+
+    @staticmethod
+    def _validate_motor(motor):
+        """Check if motor is "T" (top), "B" (bottom) or "C" (combined), otherwise log an error."""
+        if motor in ("B", "T", "C"):
+            return True
+
+        _LOGGER.error(
+            'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
+        )
+        return False
+
     def _parse_response(self, response):
         """Parse a response form the blind."""
+        # Check for actionResult (errors)
+        if response.get("actionResult") is not None:
+            # Error already logged in _send function
+            return
+
         try:
             # handle the part that is common among all blinds
-            if not self._parse_response_common(response):
-                return
+            self._parse_response_common(response)
+
+            data = response.get("data", {})
 
             # handle specific properties
             try:
-                self._status = {
-                    "T": BlindStatus(response["data"]["operation_T"]),
-                    "B": BlindStatus(response["data"]["operation_B"]),
-                }
+                status_T = BLIND_STATUS_BY_VALUE.get(data["operation_T"])
+                status_B = BLIND_STATUS_BY_VALUE.get(data["operation_B"])
             except KeyError:
                 self._status = {"T": BlindStatus.Unknown, "B": BlindStatus.Unknown}
-            except ValueError:
-                if self._status != {"T": BlindStatus.Unknown, "B": BlindStatus.Unknown}:
-                    _LOGGER.error(
-                        "Device with mac '%s' has status T: '%s', B: '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                        self.mac,
-                        response["data"].get("operation_T"),
-                        response["data"].get("operation_B"),
-                    )
-                self._status = {"T": BlindStatus.Unknown, "B": BlindStatus.Unknown}
+            else:
+                if status_T is not None and status_B is not None:
+                    self._status = {"T": status_T, "B": status_B}
+                else:
+                    if self._status != {"T": BlindStatus.Unknown, "B": BlindStatus.Unknown}:
+                        _LOGGER.error(
+                            "Device with mac '%s' has status T: '%s', B: '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                            self.mac,
+                            data.get("operation_T"),
+                            data.get("operation_B"),
+                        )
+                    self._status = {"T": BlindStatus.Unknown, "B": BlindStatus.Unknown}
+            self._status_names = {"T": self._status["T"].name, "B": self._status["B"].name}
 
             try:
-                self._limit_status = {
-                    "T": LimitStatus(response["data"]["currentState_T"]),
-                    "B": LimitStatus(response["data"]["currentState_B"]),
-                }
+                limit_T = LIMIT_STATUS_BY_VALUE.get(data["currentState_T"])
+                limit_B = LIMIT_STATUS_BY_VALUE.get(data["currentState_B"])
             except KeyError:
                 self._limit_status = {
                     "T": LimitStatus.Unknown,
                     "B": LimitStatus.Unknown,
                 }
-            except ValueError:
-                if self._limit_status != {
-                    "T": LimitStatus.Unknown,
-                    "B": LimitStatus.Unknown,
-                }:
-                    _LOGGER.error(
-                        "Device with mac '%s' has limit status T: '%s', B: '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
-                        self.mac,
-                        response["data"].get("currentState_T"),
-                        response["data"].get("currentState_B"),
-                    )
-                self._limit_status = {
-                    "T": LimitStatus.Unknown,
-                    "B": LimitStatus.Unknown,
-                }
+            else:
+                if limit_T is not None and limit_B is not None:
+                    self._limit_status = {"T": limit_T, "B": limit_B}
+                else:
+                    if self._limit_status != {
+                        "T": LimitStatus.Unknown,
+                        "B": LimitStatus.Unknown,
+                    }:
+                        _LOGGER.error(
+                            "Device with mac '%s' has limit status T: '%s', B: '%s' that is not yet known, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues.",
+                            self.mac,
+                            data.get("currentState_T"),
+                            data.get("currentState_B"),
+                        )
+                    self._limit_status = {
+                        "T": LimitStatus.Unknown,
+                        "B": LimitStatus.Unknown,
+                    }
+            self._limit_status_names = {
+                "T": self._limit_status["T"].name,
+                "B": self._limit_status["B"].name,
+            }
 
             try:
-                pos_T = response["data"]["currentPosition_T"]
-                pos_B = response["data"]["currentPosition_B"]
+                pos_T = data["currentPosition_T"]
+                pos_B = data["currentPosition_B"]
             except KeyError:
                 _LOGGER.error(
                     "Device with mac '%s' send status that did not include the position of the TDBU.",
@@ -1646,14 +2191,13 @@ class MotionTopDownBottomUp(MotionBlind):
                 pos_T = self._position["T"]
                 pos_B = self._position["B"]
 
-            pos_C = (pos_T + pos_B) / 2.0
-            self._position = {"T": pos_T, "B": pos_B, "C": pos_C}
+            self._set_position(pos_T, pos_B)
             self._angle = None
 
             try:
                 self._battery_voltage = {
-                    "T": response["data"]["batteryLevel_T"] / 100.0,
-                    "B": response["data"]["batteryLevel_B"] / 100.0,
+                    "T": data["batteryLevel_T"] / 100.0,
+                    "B": data["batteryLevel_B"] / 100.0,
                 }
             except KeyError:
                 self._battery_voltage = {"T": None, "B": None}
@@ -1662,102 +2206,88 @@ class MotionTopDownBottomUp(MotionBlind):
                     "T": self._calculate_battery_level(self._battery_voltage["T"]),
                     "B": self._calculate_battery_level(self._battery_voltage["B"]),
                 }
-                if self._voltage_mode != VoltageMode.AC and (
-                    self._battery_level["T"] >= 200.0
-                    or self._battery_level["B"] >= 200.0
-                    or self._battery_voltage["T"] <= 0.0
-                    or self._battery_voltage["B"] <= 0.0
-                ):
-                    _LOGGER.debug(
-                        "Device with mac '%s' reported voltage '%s' outside of expected limits, got raw voltages: '%s', '%s'",
-                        self.mac,
-                        self._battery_voltage,
-                        response["data"]["batteryLevel_T"],
-                        response["data"]["batteryLevel_B"],
-                    )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    if self._voltage_mode != VoltageMode.AC and (
+                        self._battery_level["T"] >= 200.0
+                        or self._battery_level["B"] >= 200.0
+                        or self._battery_voltage["T"] <= 0.0
+                        or self._battery_voltage["B"] <= 0.0
+                    ):
+                        _LOGGER.debug(
+                            "Device with mac '%s' reported voltage '%s' outside of expected limits, got raw voltages: '%s', '%s'",
+                            self.mac,
+                            self._battery_voltage,
+                            data["batteryLevel_T"],
+                            data["batteryLevel_B"],
+                        )
 
         except (KeyError, ValueError) as ex:
             _LOGGER.exception(
                 "Device with mac '%s' send an response with unexpected data, please submit an issue at https://github.com/starkillerOG/motion-blinds/issues. Response: '%s'",
                 self.mac,
-                log_hide(response),
+                LogHide(response),
             )
             raise ParseException(
                 f"Got an exception while parsing response: {log_hide(response)}"
             ) from ex
 
+    def _target_position(self):
+        """Return the position of the top and bottom motor, including the targets of pending batched commands."""
+        position = dict(self._position)
+        with self._pending_lock:
+            if self._pending_data is not None:
+                for motor in ("T", "B"):
+                    target = self._pending_data.get(f"targetPosition_{motor}")
+                    if target is not None:
+                        position[motor] = target
+        return position
+
     def Stop(self, motor: str = "B"):
         """Stop the motion of the blind."""
-        if motor == "B":
-            data = {"operation_B": 2}
-        elif motor == "T":
-            data = {"operation_T": 2}
-        elif motor == "C":
-            data = {"operation_B": 2, "operation_T": 2}
-        else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
+        if not self._validate_motor(motor):
             return
 
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.MOTOR_STOP_DATA[motor])
 
         self._parse_response(response)
 
     def Open(self, motor: str = "B"):
         """Open the blind/move the blind up."""
-        if motor == "B" and self._blind_type in [BlindType.TriangleBlind]:
-            data = {"operation_B": 1}
-        elif motor == "T" and self._blind_type in [BlindType.TriangleBlind]:
-            if self._position["B"] != 0:
+        if not self._validate_motor(motor):
+            return
+
+        if self._blind_type in [BlindType.TriangleBlind]:
+            if motor == "T" and self._position["B"] != 0:
                 _LOGGER.error(
                     "Error setting position, the top of the Triangle blind can not open withouth the bottom"
                 )
                 return
-            data = {"operation_T": 1}
-        elif motor == "C" and self._blind_type in [BlindType.TriangleBlind]:
-            data = {"operation_B": 1, "operation_T": 1}
-        elif motor == "B":
-            data = {"targetPosition_B": 0}
-        elif motor == "T":
-            data = {"targetPosition_T": 0}
-        elif motor == "C":
-            data = {"targetPosition_B": 0, "targetPosition_T": 0}
+            data = self.TRIANGLE_OPEN_DATA[motor]
         else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
-            return
+            data = self.MOTOR_OPEN_DATA[motor]
 
+        self._drop_pending()
         response = self._write(data)
 
         self._parse_response(response)
 
     def Close(self, motor: str = "B"):
         """Close the blind/move the blind down."""
-        if motor == "B" and self._blind_type in [BlindType.TriangleBlind]:
-            if self._position["T"] != 100:
+        if not self._validate_motor(motor):
+            return
+
+        if self._blind_type in [BlindType.TriangleBlind]:
+            if motor == "B" and self._position["T"] != 100:
                 _LOGGER.error(
                     "Error setting position, the bottom of the Triangle blind can not close withouth the top"
                 )
                 return
-            data = {"operation_B": 0}
-        elif motor == "T" and self._blind_type in [BlindType.TriangleBlind]:
-            data = {"operation_T": 0}
-        elif motor == "C" and self._blind_type in [BlindType.TriangleBlind]:
-            data = {"operation_B": 0, "operation_T": 0}
-        elif motor == "B":
-            data = {"targetPosition_B": 100}
-        elif motor == "T":
-            data = {"targetPosition_T": 100}
-        elif motor == "C":
-            data = {"targetPosition_B": 100, "targetPosition_T": 0}
+            data = self.TRIANGLE_CLOSE_DATA[motor]
         else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
-            return
+            data = self.MOTOR_CLOSE_DATA[motor]
 
+        self._drop_pending()
         response = self._write(data)
 
         self._parse_response(response)
@@ -1770,11 +2300,17 @@ class MotionTopDownBottomUp(MotionBlind):
         0 = open
         100 = closed
         """
+        if not self._validate_motor(motor):
+            return
+
         if width is None:
             width = self.width
 
+        # check the limits against the targets of batched commands that are not yet written
+        current = self._target_position()
+
         if motor == "B" and self._blind_type in [BlindType.TriangleBlind]:
-            if self._position["T"] == 100:
+            if current["T"] == 100:
                 data = {"targetPosition_B": position}
             else:
                 _LOGGER.error(
@@ -1782,7 +2318,7 @@ class MotionTopDownBottomUp(MotionBlind):
                 )
                 return
         elif motor == "T" and self._blind_type in [BlindType.TriangleBlind]:
-            if self._position["B"] == 0:
+            if current["B"] == 0:
                 data = {"targetPosition_T": position}
             else:
                 _LOGGER.error(
@@ -1795,26 +2331,27 @@ class MotionTopDownBottomUp(MotionBlind):
                 "targetPosition_B": max(position * 2 - 100, 0),
             }
         elif motor == "B":
-            if position >= self._position["T"]:
+            if current["T"] <= position <= 100:
                 data = {"targetPosition_B": position}
             else:
                 _LOGGER.error(
-                    "Error setting position, the bottom of the TDBU blind can not go above the top of the TDBU blind"
+                    "Error setting position, the bottom of the TDBU blind can not go above the top of the TDBU blind or below closed (100)"
                 )
                 return
         elif motor == "T":
-            if position <= self._position["B"]:
+            if 0 <= position <= current["B"]:
                 data = {"targetPosition_T": position}
             else:
                 _LOGGER.error(
-                    "Error setting position, the top of the TDBU blind can not go below the bottom of the TDBU blind"
+                    "Error setting position, the top of the TDBU blind can not go below the bottom of the TDBU blind or above open (0)"
                 )
                 return
-        elif motor == "C":
-            if width / 2.0 <= position <= (100 - width / 2.0):
+        else:
+            half_width = width / 2.0
+            if half_width <= position <= (100 - half_width):
                 data = {
-                    "targetPosition_T": position - width / 2.0,
-                    "targetPosition_B": position + width / 2.0,
+                    "targetPosition_T": position - half_width,
+                    "targetPosition_B": position + half_width,
                 }
             else:
                 _LOGGER.error(
@@ -1823,15 +2360,8 @@ class MotionTopDownBottomUp(MotionBlind):
                     width,
                 )
                 return
-        else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
-            return
 
-        response = self._write(data)
-
-        self._parse_response(response)
+        self._write_batched(data)
 
     def Set_scaled_position(self, scaled_position, motor: str = "B"):
         """
@@ -1845,6 +2375,9 @@ class MotionTopDownBottomUp(MotionBlind):
             0 = at position of the top blind
             100 = closed
         """
+        if not self._validate_motor(motor):
+            return
+
         if self._blind_type in [BlindType.TriangleBlind]:
             self.Set_position(scaled_position, motor)
             return
@@ -1852,18 +2385,13 @@ class MotionTopDownBottomUp(MotionBlind):
         if motor == "B":
             pos_bottom = self._position["T"] + (100.0 - self._position["T"]) * scaled_position / 100.0
             self.Set_position(pos_bottom, motor)
-            return
-        if motor == "T":
+        elif motor == "T":
             pos_top = scaled_position * self._position["B"] / 100.0
             self.Set_position(pos_top, motor)
-            return
-        if motor == "C":
-            pos_combined = self.width / 2.0 + scaled_position * (100.0 - self.width) / 100.0
+        else:
+            width = self.width
+            pos_combined = width / 2.0 + scaled_position * (100.0 - width) / 100.0
             self.Set_position(pos_combined, motor)
-            return
-
-        _LOGGER.error('Please specify which motor to control "T" (top) or "B" (bottom)')
-        return
 
     def Set_angle(self, angle, motor: str = "B"):
         """
@@ -1871,78 +2399,29 @@ class MotionTopDownBottomUp(MotionBlind):
 
         angle is in degrees, so 0-180
         """
-        target_angle = round(angle * self._max_angle / 180.0, 0)
-
-        if motor == "B":
-            data = {"targetAngle_B": target_angle}
-        elif motor == "T":
-            data = {"targetAngle_T": target_angle}
-        elif motor == "C":
-            data = {"targetAngle_B": target_angle, "targetAngle_T": target_angle}
-        else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
+        if not self._validate_motor(motor):
             return
 
-        response = self._write(data)
-
-        self._parse_response(response)
+        data = dict.fromkeys(self.MOTOR_ANGLE_KEYS[motor], round(angle * self._angle_to_device, 0))
+        self._write_batched(data)
 
     def Jog_up(self, motor: str = "B"):
         """Open the blind/move the blind one step up."""
-        if motor == "B":
-            data = {"operation_B": 7}
-        elif motor == "T":
-            data = {"operation_T": 7}
-        elif motor == "C":
-            data = {"operation_B": 7, "operation_T": 7}
-        else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
+        if not self._validate_motor(motor):
             return
 
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.MOTOR_JOG_UP_DATA[motor])
 
         self._parse_response(response)
 
     def Jog_down(self, motor: str = "B"):
         """Close the blind/move the blind one step down."""
-        if motor == "B":
-            data = {"operation_B": 8}
-        elif motor == "T":
-            data = {"operation_T": 8}
-        elif motor == "C":
-            data = {"operation_B": 8, "operation_T": 8}
-        else:
-            _LOGGER.error(
-                'Please specify which motor to control "T" (top), "B" (bottom) or "C" (combined)'
-            )
+        if not self._validate_motor(motor):
             return
 
-        response = self._write(data)
-
-        self._parse_response(response)
-
-    def Set_favorite_position(self):
-        """
-        Set current position as favorite position.
-
-        First the blind needs to be put in configuration mode (stepping up/down).
-        This is done by shortly pressing the reset button on the physical device.
-        """
-        data = {"operation_B": 11, "operation_T": 11}
-
-        response = self._write(data)
-
-        self._parse_response(response)
-
-    def Go_favorite_position(self):
-        """Move the blind to the favorite position."""
-        data = {"operation_B": 12, "operation_T": 12}
-
-        response = self._write(data)
+        self._drop_pending()
+        response = self._write(self.MOTOR_JOG_DOWN_DATA[motor])
 
         self._parse_response(response)
 
@@ -1957,52 +2436,71 @@ class MotionTopDownBottomUp(MotionBlind):
         if self._blind_type in [BlindType.TriangleBlind]:
             return self._position
 
-        if self._position["B"] > 0:
-            pos_top = round(self._position["T"] * 100.0 / self._position["B"], 1)
+        if self._scaled_position is not None:
+            # a copy, such that callers can not modify the cache
+            return dict(self._scaled_position)
+
+        pos_T = self._position["T"]
+        pos_B = self._position["B"]
+        width = self.width
+
+        if pos_B > 0:
+            pos_top = round(pos_T * 100.0 / pos_B, 1)
         else:
             pos_top = 0
 
-        if self._position["T"] < 100:
-            pos_bottom = round(
-                (self._position["B"] - self._position["T"])* 100.0 / (100.0 - self._position["T"]),
-                1,
-            )
+        if pos_T < 100:
+            pos_bottom = round((pos_B - pos_T) * 100.0 / (100.0 - pos_T), 1)
         else:
             pos_bottom = 100
 
-        if self.width < 100:
+        if width < 100:
             pos_combined = round(
-                (self._position["C"] - self.width / 2.0) * 100.0 / (100.0 - self.width),
+                (self._position["C"] - width / 2.0) * 100.0 / (100.0 - width),
                 1,
             )
         else:
             pos_combined = 100
 
-        return {"T": pos_top, "B": pos_bottom, "C": pos_combined}
+        self._scaled_position = {"T": pos_top, "B": pos_bottom, "C": pos_combined}
+        return dict(self._scaled_position)
 
     @property
     def width(self):
         """Return the current width of the closed surface in % (0-100)."""
-        if self._blind_type in [BlindType.TriangleBlind]:
-            return (self._position["B"] + self._position["T"]) / 2
+        if self._width is None:
+            if self._blind_type in [BlindType.TriangleBlind]:
+                self._width = (self._position["B"] + self._position["T"]) / 2
+            else:
+                self._width = self._position["B"] - self._position["T"]
 
-        return self._position["B"] - self._position["T"]
+        return self._width
 
     @property
     def status(self):
         """Return the current status of the blind from BlindStatus enum."""
-        if self._status is not None:
-            return {"T": self._status["T"].name, "B": self._status["B"].name}
+        if self._status_names is not None:
+            # a copy, such that callers can not modify the cached names
+            return dict(self._status_names)
 
-        return self._status
+        return self._status_names
 
     @property
     def limit_status(self):
         """Return the current status of the limit detection of the blind from LimitStatus enum."""
-        if self._limit_status is not None:
-            return {
-                "T": self._limit_status["T"].name,
-                "B": self._limit_status["B"].name,
-            }
-
-        return self._limit_status
+        if self._limit_status_names is not None:
+            # a copy, such that callers can not modify the cached names
+            return dict(self._limit_status_names)
+
+        return self._limit_status_names
+
+
+# Blind class and extra init arguments to use for each device type in the device list
+BLIND_FACTORY = {
+    DEVICE_TYPE_BLIND: (MotionBlind, {}),
+    DEVICE_TYPE_DR: (MotionBlind, {"max_angle": 90}),
+    DEVICE_TYPE_TDBU: (MotionTopDownBottomUp, {}),
+    DEVICE_TYPE_WIFI_BLIND: (MotionBlind, {}),
+    DEVICE_TYPE_WIFI_CURTAIN: (MotionBlind, {}),
+    DEVICE_TYPE_WIFI_GATE: (MotionBlind, {}),
+}